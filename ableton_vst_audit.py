@@ -6,19 +6,238 @@ Supports both GUI and command-line interfaces.
 """
 
 import os
+import io
+import re
 import sys
-import gzip
-import xml.etree.ElementTree as ET
+import html
+import json
+import mmap
+import shutil
+import tempfile
+import functools
+import contextlib
 import argparse
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import threading
 
+# Elements that still need the XML tree: manufacturer hints and plugin names
+STRUCTURAL_TAGS = frozenset({'BrowserContentPath', 'VstPluginInfo', 'Vst3PluginInfo', 'PluginDesc'})
+
+# Prefer lxml's C parser when it is installed; the stdlib parser is the fallback
+try:
+    from lxml import etree as ET
+    _ITERPARSE_OPTIONS = {'huge_tree': True}
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _ITERPARSE_OPTIONS = {}
+
+# python-isal decompresses considerably faster than the stdlib gzip module
+try:
+    from isal import igzip_threaded as gzip_mod
+except ImportError:
+    import gzip as gzip_mod
+
+# Larger reads from the decompressor mean fewer round trips into the parser
+READ_BUFFER_SIZE = 128 * 1024
+
+# Compressed projects at least this big are decompressed to a memory-mapped temp file
+SPOOL_THRESHOLD = 16 * 1024 * 1024
+
+# A DLL reference is an attribute value (either quote style) or text node ending in ".dll"
+DLL_PATH_RE = re.compile(
+    rb'"([^"<]*\.dll)\s*"|\'([^\'<]*\.dll)\s*\'|>([^<>]*\.dll)\s*<',
+    re.IGNORECASE,
+)
+
+# Windows and POSIX path separators, repeated separators collapsed
+_SEP_RE = re.compile(r'[\\/]+')
+
+# The first path component that names a DLL
+_DLL_COMPONENT_RE = re.compile(r'[^\\/]*\.dll(?=[\\/]|\Z)', re.IGNORECASE)
+
+# Common folder names to skip when looking for a manufacturer in a DLL path
+_SKIP_FOLDERS = frozenset({
+    'vst', 'vst2', 'vst3', '_effects', '_effects 2', 'effects', 'mastering',
+    'reverb', 'distortion', 'slowmo', 'delay', 'compression', 'eq', 'modulation',
+    'd:', 'c:', 'program files', 'program files (x86)', 'x64', 'x86', 'plugins',
+    'steinberg', 'vstplugins', '64-bit', '32-bit'
+})
+
+# Known manufacturer patterns, checked in order against lowercased plugin names
+MANUFACTURER_PATTERNS = {
+    'tal-': 'TAL-Software',
+    'labs': 'Spitfire Audio',
+    'ozone': 'iZotope',
+    'levels': 'Mastering the Mix',
+    'rc-20': 'XLN Audio',
+    'halftime': 'Cable Guys',
+    'blackhole': 'Eventide',
+    'decapitator': 'Soundtoys',
+    'waveshell': 'Waves',
+    '2getheraudio': '2getheraudio',
+    'cherry': 'Cherry Audio'
+}
+
+
+def _build_manufacturer_automaton():
+    """Compile MANUFACTURER_PATTERNS into an Aho-Corasick automaton, if available."""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for priority, (pattern, manufacturer) in enumerate(MANUFACTURER_PATTERNS.items()):
+        automaton.add_word(pattern, (priority, manufacturer))
+    automaton.make_automaton()
+    return automaton
+
+
+_MANUFACTURER_AUTOMATON = _build_manufacturer_automaton()
+
+# Reports are assembled in memory and flushed in one write
+REPORT_BUFFER_SIZE = 1024 * 1024
+
+# Parse results are kept here between runs so unchanged projects are not re-parsed
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.ableton_vst_audit_cache.sqlite3')
+
+# Bump whenever parsing changes so results cached by older versions are ignored
+CACHE_VERSION = 3
+
+# Below this many files the process pool start-up costs more than it saves
+PARALLEL_MIN_FILES = 4
+
+
+def ends_with_dll(value):
+    """Case-insensitive ".dll" suffix check that only lowercases the last four characters."""
+    return len(value) >= 4 and value[-4:].lower() == '.dll'
+
+
+@functools.lru_cache(maxsize=None)
+def extract_manufacturer_from_path(dll_path):
+    """Extract manufacturer name from DLL file path."""
+    if not dll_path:
+        return None
+    
+    # The regex engine locates the DLL component; only the folders before it are split
+    match = _DLL_COMPONENT_RE.search(dll_path)
+    if not match:
+        return None
+    
+    # Look for manufacturer names in path (usually in folder names before the DLL)
+    for folder in reversed(_SEP_RE.split(dll_path[:match.start()])):
+        folder = folder.strip()
+        if folder and folder.lower() not in _SKIP_FOLDERS and len(folder) > 2:
+            return folder
+    
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_manufacturer_from_plugin_name(plugin_name):
+    """Get manufacturer from plugin name using known patterns and databases."""
+    if not plugin_name:
+        return None
+        
+    plugin_lower = plugin_name.lower()
+    
+    if _MANUFACTURER_AUTOMATON is not None:
+        # Single pass over the name; the earliest listed pattern wins
+        matches = [value for _, value in _MANUFACTURER_AUTOMATON.iter(plugin_lower)]
+        return min(matches)[1] if matches else None
+    
+    for pattern, manufacturer in MANUFACTURER_PATTERNS.items():
+        if pattern in plugin_lower:
+            return manufacturer
+    
+    return None
+
+
+class ParseCache:
+    """SQLite cache of per-project parse results, keyed by path, mtime and size.
+    
+    The cache is only an optimisation: after the first SQLite error (a locked
+    or read-only database, say) it warns once and behaves as if empty.
+    """
+    
+    def __init__(self, cache_path):
+        # Imported here because some Python builds ship without _sqlite3; the
+        # cache is only an optimisation and scans work without it
+        import sqlite3
+        self.cache_path = cache_path
+        self.error_types = (sqlite3.Error, ValueError)
+        self.conn = sqlite3.connect(cache_path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS parse_cache ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, version INTEGER, result TEXT)"
+        )
+    
+    def disable(self, error):
+        """Warn about a cache error and stop using the database for this scan."""
+        print(f"Parse cache disabled ({self.cache_path}): {error}")
+        conn, self.conn = self.conn, None
+        try:
+            conn.close()
+        except self.error_types:
+            pass
+    
+    def key(self, file_path):
+        """Return the cache key for a file, or None if it cannot be stat'ed."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return os.path.abspath(file_path), st.st_mtime_ns, st.st_size
+    
+    def get(self, key):
+        """Return cached (vsts_found, local_manufacturers) for a key, or None."""
+        if self.conn is None:
+            return None
+        try:
+            row = self.conn.execute(
+                "SELECT result FROM parse_cache WHERE path = ? AND mtime_ns = ? AND size = ? AND version = ?",
+                key + (CACHE_VERSION,)
+            ).fetchone()
+            if row is None:
+                return None
+            vsts_found, local_manufacturers = json.loads(row[0])
+        except self.error_types as e:
+            self.disable(e)
+            return None
+        return vsts_found, local_manufacturers
+    
+    def put(self, key, vsts_found, local_manufacturers):
+        """Store the parse result for a key, replacing any older entry for the path."""
+        if self.conn is None:
+            return
+        # Committed per result so the write lock on the shared database is
+        # only held briefly and other scans can still use it
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO parse_cache (path, mtime_ns, size, version, result) VALUES (?, ?, ?, ?, ?)",
+                    key + (CACHE_VERSION, json.dumps([vsts_found, local_manufacturers]))
+                )
+        except self.error_types as e:
+            self.disable(e)
+    
+    def close(self):
+        """Close the database."""
+        if self.conn is None:
+            return
+        try:
+            self.conn.close()
+        except self.error_types as e:
+            print(f"Parse cache could not be closed ({self.cache_path}): {e}")
+        self.conn = None
+
 
 class AbletonVSTAuditor:
-    def __init__(self):
+    def __init__(self, cache_path=DEFAULT_CACHE_PATH):
         self.vst_usage = Counter()
         self.project_vsts = defaultdict(list)
         self.vst_manufacturers = {}  # VST name -> manufacturer mapping
@@ -26,159 +245,108 @@ class AbletonVSTAuditor:
         self.total_files = 0
         self.current_file = ""
         self.progress_callback = None
+        self.cache_path = cache_path  # None disables the parse cache
         
     def find_als_files(self, directory):
         """Recursively find all .als files in the given directory."""
         als_files = []
-        try:
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    if file.lower().endswith('.als'):
-                        als_files.append(os.path.join(root, file))
-        except (OSError, PermissionError) as e:
-            print(f"Error accessing directory {directory}: {e}")
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            subdirs = []
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name.lower().endswith('.als'):
+                            als_files.append(entry.path)
+            except (OSError, PermissionError) as e:
+                print(f"Error accessing directory {current}: {e}")
+            # Reversed so directories are visited in the same order as os.walk
+            stack.extend(reversed(subdirs))
         return als_files
     
-    def extract_manufacturer_from_path(self, dll_path):
-        """Extract manufacturer name from DLL file path."""
-        if not dll_path:
-            return None
-            
-        # Common folder names to skip
-        skip_folders = {
-            'vst', 'vst2', 'vst3', '_effects', '_effects 2', 'effects', 'mastering', 
-            'reverb', 'distortion', 'slowmo', 'delay', 'compression', 'eq', 'modulation',
-            'd:', 'c:', 'program files', 'program files (x86)', 'x64', 'x86', 'plugins',
-            'steinberg', 'vstplugins', '64-bit', '32-bit'
-        }
-        
-        path_parts = dll_path.replace('\\', '/').split('/')
-        
-        # Look for manufacturer names in path (usually in folder names before the DLL)
-        for i, part in enumerate(path_parts):
-            if part.lower().endswith('.dll'):
-                # Check the folders before the DLL
-                for j in range(i-1, -1, -1):
-                    folder = path_parts[j].strip()
-                    if folder and folder.lower() not in skip_folders and len(folder) > 2:
-                        return folder
-                break
-        
-        return None
-    
-    def get_manufacturer_from_plugin_name(self, plugin_name):
-        """Get manufacturer from plugin name using known patterns and databases."""
-        if not plugin_name:
-            return None
-            
-        plugin_lower = plugin_name.lower()
-        
-        # Known manufacturer patterns
-        manufacturer_patterns = {
-            'tal-': 'TAL-Software',
-            'labs': 'Spitfire Audio',
-            'ozone': 'iZotope',
-            'levels': 'Mastering the Mix',
-            'rc-20': 'XLN Audio',
-            'halftime': 'Cable Guys',
-            'blackhole': 'Eventide',
-            'decapitator': 'Soundtoys',
-            'waveshell': 'Waves',
-            '2getheraudio': '2getheraudio',
-            'cherry': 'Cherry Audio'
-        }
-        
-        for pattern, manufacturer in manufacturer_patterns.items():
-            if pattern in plugin_lower:
-                return manufacturer
-        
-        return None
+    extract_manufacturer_from_path = staticmethod(extract_manufacturer_from_path)
+    get_manufacturer_from_plugin_name = staticmethod(get_manufacturer_from_plugin_name)
     
     def parse_als_file(self, file_path):
         """Parse an .als file and extract VST information."""
-        vsts_found = []
-        local_manufacturers = {}
-        
-        try:
-            with gzip.open(file_path, 'rt', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-                root = ET.fromstring(content)
-                
-                # Search all elements for VST DLL references
-                for elem in root.iter():
-                    # Check element text content
-                    if elem.text and '.dll' in elem.text.lower():
-                        dll_path = elem.text.strip()
-                        dll_name = os.path.basename(dll_path)
-                        if dll_name and dll_name not in vsts_found:
-                            vsts_found.append(dll_name)
-                            # Extract manufacturer from path
-                            manufacturer = self.extract_manufacturer_from_path(dll_path)
-                            if manufacturer and dll_name not in local_manufacturers:
-                                local_manufacturers[dll_name] = manufacturer
-                    
-                    # Check all attributes for DLL paths
-                    for attr_name, attr_value in elem.attrib.items():
-                        if attr_value and '.dll' in attr_value.lower():
-                            dll_path = attr_value.strip()
-                            dll_name = os.path.basename(dll_path)
-                            if dll_name and dll_name not in vsts_found:
-                                vsts_found.append(dll_name)
-                                # Extract manufacturer from path
-                                manufacturer = self.extract_manufacturer_from_path(dll_path)
-                                if manufacturer and dll_name not in local_manufacturers:
-                                    local_manufacturers[dll_name] = manufacturer
-                    
-                    # Check BrowserContentPath for manufacturer info (format: query:Plugins#VST:Manufacturer:PluginName)
-                    if elem.tag == 'BrowserContentPath':
-                        value_elem = elem.find('Value')
-                        if value_elem is not None and value_elem.text:
-                            browser_path = value_elem.text
-                            if 'Plugins#VST' in browser_path and ':' in browser_path:
-                                parts = browser_path.split(':')
-                                if len(parts) >= 4:  # query:Plugins#VST:Manufacturer:PluginName
-                                    manufacturer = parts[2].replace('%20', ' ')  # URL decode spaces
-                                    plugin_name = parts[3].replace('%20', ' ')
-                                    # Find matching VST and associate manufacturer
-                                    for vst in vsts_found:
-                                        if plugin_name.lower() in vst.lower() or vst.lower() in plugin_name.lower():
-                                            local_manufacturers[vst] = manufacturer
-                    
-                    # Special handling for plugin name elements
-                    if elem.tag in ['VstPluginInfo', 'Vst3PluginInfo', 'PluginDesc']:
-                        # Look for Name attribute or child elements
-                        name = elem.get('Name')
-                        if name and name not in vsts_found and not name.endswith('.dll'):
-                            vsts_found.append(name)
-                        
-                        # Check child elements for plugin names
-                        for child in elem:
-                            if child.text and not child.text.endswith('.dll') and len(child.text) < 100:
-                                plugin_name = child.text.strip()
-                                if plugin_name and plugin_name not in vsts_found:
-                                    vsts_found.append(plugin_name)
-                
-                # Update global manufacturer mapping, trying multiple methods
-                for vst in vsts_found:
-                    if vst not in self.vst_manufacturers:
-                        # Try different methods to find manufacturer
-                        manufacturer = (
-                            local_manufacturers.get(vst) or  # From path
-                            self.get_manufacturer_from_plugin_name(vst) or  # From name patterns
-                            "Unknown"
-                        )
-                        self.vst_manufacturers[vst] = manufacturer
-                
-        except Exception as e:
-            print(f"Error parsing {file_path}: {e}")
-        
-        return list(set(vsts_found))  # Remove duplicates
+        _, vsts_found, local_manufacturers = parse_als_file_worker(file_path)
+        if vsts_found is None:
+            return []
+        self.record_manufacturers(vsts_found, local_manufacturers)
+        return vsts_found
+    
+    def record_manufacturers(self, vsts_found, local_manufacturers):
+        """Update the global manufacturer mapping for VSTs found in a project."""
+        for vst in vsts_found:
+            if vst not in self.vst_manufacturers:
+                # Try different methods to find manufacturer
+                manufacturer = (
+                    local_manufacturers.get(vst) or  # From path
+                    self.get_manufacturer_from_plugin_name(vst) or  # From name patterns
+                    "Unknown"
+                )
+                self.vst_manufacturers[vst] = manufacturer
     
     def update_progress(self, message):
         """Update progress if callback is set."""
         if self.progress_callback:
             self.progress_callback(message)
     
+    def open_cache(self):
+        """Open the parse cache, or return None if it is disabled or unavailable."""
+        if not self.cache_path:
+            return None
+        try:
+            import sqlite3
+        except ImportError as e:
+            print(f"Parse cache unavailable: {e}")
+            return None
+        try:
+            return ParseCache(self.cache_path)
+        except sqlite3.Error as e:
+            print(f"Parse cache unavailable ({self.cache_path}): {e}")
+            return None
+    
+    def parse_files(self, als_files):
+        """Parse .als files, in parallel processes when there are enough of them."""
+        if len(als_files) < PARALLEL_MIN_FILES:
+            for file_path in als_files:
+                yield parse_als_file_worker(file_path)
+            return
+        
+        with ProcessPoolExecutor() as executor:
+            yield from executor.map(parse_als_file_worker, als_files, chunksize=4)
+    
+    def iter_parse_results(self, als_files, cache=None):
+        """Yield parse results in file order, reusing cached results where possible."""
+        keys = {}
+        cached = {}
+        if cache is not None:
+            for file_path in als_files:
+                keys[file_path] = cache.key(file_path)
+                if keys[file_path] is not None:
+                    hit = cache.get(keys[file_path])
+                    if hit is not None:
+                        cached[file_path] = hit
+        
+        # Only cache misses go to the parser; map() keeps them in file order
+        parsed = self.parse_files([fp for fp in als_files if fp not in cached])
+        for file_path in als_files:
+            if file_path in cached:
+                yield (file_path,) + cached[file_path]
+                continue
+            
+            result = next(parsed)
+            _, vsts, local_manufacturers = result
+            # Failed parses are not cached so they are retried on the next scan
+            if cache is not None and keys[file_path] is not None and vsts is not None:
+                cache.put(keys[file_path], vsts, local_manufacturers)
+            yield result
+        parsed.close()
+    
     def scan_directory(self, directory):
         """Scan directory for .als files and extract VST information."""
         self.vst_usage.clear()
@@ -195,67 +363,190 @@ class AbletonVSTAuditor:
         
         self.update_progress(f"Found {self.total_files} .als files. Starting scan...")
         
-        for file_path in als_files:
-            self.current_file = os.path.basename(file_path)
-            self.update_progress(f"Processing: {self.current_file}")
-            
-            vsts = self.parse_als_file(file_path)
-            
-            if vsts:
-                self.project_vsts[file_path] = vsts
-                for vst in vsts:
-                    self.vst_usage[vst] += 1
-            
-            self.processed_files += 1
+        cache = self.open_cache()
+        try:
+            for file_path, vsts, local_manufacturers in self.iter_parse_results(als_files, cache):
+                self.current_file = os.path.basename(file_path)
+                self.update_progress(f"Processing: {self.current_file}")
+                
+                if vsts:
+                    self.record_manufacturers(vsts, local_manufacturers)
+                    self.project_vsts[file_path] = vsts
+                    self.vst_usage.update(vsts)
+                
+                self.processed_files += 1
+        finally:
+            if cache is not None:
+                cache.close()
             
         self.update_progress(f"Scan complete! Found {len(self.vst_usage)} unique VSTs")
     
     def generate_report(self, output_file):
         """Generate a detailed report of VST usage."""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("ABLETON VST AUDIT REPORT\n")
-            f.write("=" * 50 + "\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total Projects Scanned: {len(self.project_vsts)}\n")
-            f.write(f"Total Unique VSTs Found: {len(self.vst_usage)}\n\n")
+        out = []
+        out.append("ABLETON VST AUDIT REPORT\n")
+        out.append("=" * 50 + "\n")
+        out.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        out.append(f"Total Projects Scanned: {len(self.project_vsts)}\n")
+        out.append(f"Total Unique VSTs Found: {len(self.vst_usage)}\n\n")
+        
+        if self.vst_usage:
+            out.append("VST USAGE SUMMARY (by frequency)\n")
+            out.append("-" * 40 + "\n")
+            for vst, count in self.vst_usage.most_common():
+                manufacturer = self.vst_manufacturers.get(vst, "Unknown")
+                out.append(f"{count:3d}x  {vst:<35} [{manufacturer}]\n")
             
-            if self.vst_usage:
-                f.write("VST USAGE SUMMARY (by frequency)\n")
-                f.write("-" * 40 + "\n")
-                for vst, count in self.vst_usage.most_common():
-                    manufacturer = self.vst_manufacturers.get(vst, "Unknown")
-                    f.write(f"{count:3d}x  {vst:<35} [{manufacturer}]\n")
-                
-                f.write("\n\nVSTS BY MANUFACTURER\n")
-                f.write("-" * 30 + "\n")
-                # Group VSTs by manufacturer
-                by_manufacturer = defaultdict(list)
-                for vst in self.vst_usage.keys():
-                    manufacturer = self.vst_manufacturers.get(vst, "Unknown")
-                    by_manufacturer[manufacturer].append((vst, self.vst_usage[vst]))
-                
-                for manufacturer in sorted(by_manufacturer.keys()):
-                    f.write(f"\n{manufacturer}:\n")
-                    vst_list = sorted(by_manufacturer[manufacturer], key=lambda x: x[0])
-                    for vst, count in vst_list:
-                        f.write(f"  • {vst} ({count}x)\n")
-                
-                f.write("\n\nALPHABETICAL VST LIST\n")
-                f.write("-" * 30 + "\n")
-                for vst in sorted(self.vst_usage.keys()):
+            out.append("\n\nVSTS BY MANUFACTURER\n")
+            out.append("-" * 30 + "\n")
+            # Group VSTs by manufacturer
+            by_manufacturer = defaultdict(list)
+            for vst in self.vst_usage.keys():
+                manufacturer = self.vst_manufacturers.get(vst, "Unknown")
+                by_manufacturer[manufacturer].append((vst, self.vst_usage[vst]))
+            
+            for manufacturer in sorted(by_manufacturer.keys()):
+                out.append(f"\n{manufacturer}:\n")
+                vst_list = sorted(by_manufacturer[manufacturer], key=lambda x: x[0])
+                for vst, count in vst_list:
+                    out.append(f"  • {vst} ({count}x)\n")
+            
+            out.append("\n\nALPHABETICAL VST LIST\n")
+            out.append("-" * 30 + "\n")
+            for vst in sorted(self.vst_usage.keys()):
+                manufacturer = self.vst_manufacturers.get(vst, "Unknown")
+                out.append(f"• {vst:<35} [{manufacturer}]\n")
+            
+            out.append("\n\nPROJECT BREAKDOWN\n")
+            out.append("-" * 25 + "\n")
+            for project_path, vsts in self.project_vsts.items():
+                project_name = os.path.basename(project_path)
+                out.append(f"\n{project_name}:\n")
+                for vst in sorted(set(vsts)):
                     manufacturer = self.vst_manufacturers.get(vst, "Unknown")
-                    f.write(f"• {vst:<35} [{manufacturer}]\n")
-                
-                f.write("\n\nPROJECT BREAKDOWN\n")
-                f.write("-" * 25 + "\n")
-                for project_path, vsts in self.project_vsts.items():
-                    project_name = os.path.basename(project_path)
-                    f.write(f"\n{project_name}:\n")
-                    for vst in sorted(set(vsts)):
-                        manufacturer = self.vst_manufacturers.get(vst, "Unknown")
-                        f.write(f"  • {vst:<35} [{manufacturer}]\n")
+                    out.append(f"  • {vst:<35} [{manufacturer}]\n")
+        else:
+            out.append("No VST plugins found in the scanned projects.\n")
+        
+        with open(output_file, 'w', encoding='utf-8', buffering=REPORT_BUFFER_SIZE) as f:
+            f.write(''.join(out))
+
+
+def open_project(file_path):
+    """Open an .als file as a buffered stream of decompressed XML bytes."""
+    return io.BufferedReader(gzip_mod.open(file_path, 'rb'), buffer_size=READ_BUFFER_SIZE)
+
+
+@contextlib.contextmanager
+def decompressed_project(file_path):
+    """Yield the decompressed XML of an .als file as a bytes-like buffer.
+    
+    Large projects are spooled to a temporary file and memory-mapped instead
+    of being held on the Python heap.
+    """
+    if os.path.getsize(file_path) < SPOOL_THRESHOLD:
+        with open_project(file_path) as f:
+            data = f.read()
+        yield data
+        return
+    
+    with tempfile.TemporaryFile() as spool:
+        with open_project(file_path) as f:
+            shutil.copyfileobj(f, spool, READ_BUFFER_SIZE)
+        if spool.tell() == 0:
+            # mmap cannot map an empty file
+            yield b''
+            return
+        spool.flush()
+        with mmap.mmap(spool.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+def parse_als_file_worker(file_path):
+    """Parse an .als file and extract VST information.
+    
+    Module-level so it can be pickled for a process pool. Returns
+    (file_path, vsts_found, local_manufacturers); vsts_found is None if the
+    file could not be parsed.
+    """
+    try:
+        with decompressed_project(file_path) as data:
+            vsts_found, local_manufacturers = _scan_project_xml(data, file_path)
+    
+    except Exception as e:
+        print(f"Error parsing {file_path}: {e}")
+        return file_path, None, {}
+    
+    return file_path, list(vsts_found), local_manufacturers
+
+
+def _scan_project_xml(data, file_path):
+    """Extract VST names and manufacturer hints from decompressed project XML.
+    
+    The DLL references found by the regex pass are kept even if the XML
+    turns out to be malformed; only the structural lookups are lost.
+    """
+    vsts_found = set()
+    local_manufacturers = {}
+    
+    # Find DLL references straight from the raw XML; the regex engine does
+    # in C what would otherwise be a lower() and substring test per node
+    raw_paths = (m.group(m.lastindex) for m in DLL_PATH_RE.finditer(data))
+    for raw_path in dict.fromkeys(raw_paths):
+        dll_path = html.unescape(raw_path.decode('utf-8', errors='replace')).strip()
+        dll_name = os.path.basename(dll_path)
+        if dll_name and dll_name not in vsts_found:
+            vsts_found.add(dll_name)
+            # Extract manufacturer from path
+            manufacturer = extract_manufacturer_from_path(dll_path)
+            if manufacturer and dll_name not in local_manufacturers:
+                local_manufacturers[dll_name] = manufacturer
+    
+    # The XML parser is only needed for the structural lookups below
+    source = data if isinstance(data, mmap.mmap) else io.BytesIO(data)
+    try:
+        for event, elem in ET.iterparse(source, events=('end',), **_ITERPARSE_OPTIONS):
+            if elem.tag not in STRUCTURAL_TAGS:
+                del elem[:]
+                continue
+            
+            # Check BrowserContentPath for manufacturer info (format: query:Plugins#VST:Manufacturer:PluginName)
+            if elem.tag == 'BrowserContentPath':
+                value_elem = elem.find('Value')
+                if value_elem is not None and value_elem.text:
+                    browser_path = value_elem.text
+                    if 'Plugins#VST' in browser_path and ':' in browser_path:
+                        parts = browser_path.split(':')
+                        if len(parts) >= 4:  # query:Plugins#VST:Manufacturer:PluginName
+                            manufacturer = parts[2].replace('%20', ' ')  # URL decode spaces
+                            plugin_name = parts[3].replace('%20', ' ')
+                            # Find matching VST and associate manufacturer; every DLL is
+                            # already known here, including ones referenced further on
+                            for vst in vsts_found:
+                                if plugin_name.lower() in vst.lower() or vst.lower() in plugin_name.lower():
+                                    local_manufacturers[vst] = manufacturer
+            
+            # Special handling for plugin name elements
             else:
-                f.write("No VST plugins found in the scanned projects.\n")
+                # Look for Name attribute or child elements
+                name = elem.get('Name')
+                if name and not ends_with_dll(name):
+                    vsts_found.add(name)
+                
+                # Check child elements for plugin names
+                for child in elem:
+                    if child.text and not ends_with_dll(child.text) and len(child.text) < 100:
+                        plugin_name = child.text.strip()
+                        if plugin_name:
+                            vsts_found.add(plugin_name)
+            
+            # Children have been inspected by now; drop them to free memory.
+            # The root element ends last, so this also empties the tree.
+            del elem[:]
+    except ET.ParseError as e:
+        print(f"Warning: {file_path} is not well-formed XML ({e}); only DLL references were read")
+    
+    return vsts_found, local_manufacturers
 
 
 class AbletonVSTGUI:
@@ -386,17 +677,18 @@ class AbletonVSTGUI:
             self.results_text.insert(tk.END, "No VST plugins found in the scanned projects.")
             return
         
-        self.results_text.insert(tk.END, f"SCAN RESULTS\n")
-        self.results_text.insert(tk.END, f"Projects scanned: {len(self.auditor.project_vsts)}\n")
-        self.results_text.insert(tk.END, f"Unique VSTs found: {len(self.auditor.vst_usage)}\n\n")
+        out = []
+        out.append(f"SCAN RESULTS\n")
+        out.append(f"Projects scanned: {len(self.auditor.project_vsts)}\n")
+        out.append(f"Unique VSTs found: {len(self.auditor.vst_usage)}\n\n")
         
-        self.results_text.insert(tk.END, "TOP VSTs (by usage):\n")
+        out.append("TOP VSTs (by usage):\n")
         for i, (vst, count) in enumerate(self.auditor.vst_usage.most_common(20), 1):
             manufacturer = self.auditor.vst_manufacturers.get(vst, "Unknown")
-            self.results_text.insert(tk.END, f"{i:2d}. {vst} ({count}x) [{manufacturer}]\n")
+            out.append(f"{i:2d}. {vst} ({count}x) [{manufacturer}]\n")
         
         if len(self.auditor.vst_usage) > 20:
-            self.results_text.insert(tk.END, f"\n... and {len(self.auditor.vst_usage) - 20} more\n")
+            out.append(f"\n... and {len(self.auditor.vst_usage) - 20} more\n")
             
         # Show manufacturer summary
         manufacturer_counts = defaultdict(int)
@@ -404,9 +696,12 @@ class AbletonVSTGUI:
             manufacturer = self.auditor.vst_manufacturers.get(vst, "Unknown")
             manufacturer_counts[manufacturer] += 1
         
-        self.results_text.insert(tk.END, f"\nMANUFACTURERS FOUND:\n")
+        out.append(f"\nMANUFACTURERS FOUND:\n")
         for manufacturer, count in sorted(manufacturer_counts.items(), key=lambda x: -x[1]):
-            self.results_text.insert(tk.END, f"• {manufacturer}: {count} plugin(s)\n")
+            out.append(f"• {manufacturer}: {count} plugin(s)\n")
+        
+        # One insert lets Tk lay out the text once instead of once per line
+        self.results_text.insert(tk.END, ''.join(out))
     
     def save_report(self):
         """Save detailed report to file."""
@@ -438,6 +733,7 @@ def main():
     parser.add_argument("--cli", action="store_true", help="Use command-line interface")
     parser.add_argument("directory", nargs="?", help="Directory to scan (CLI mode)")
     parser.add_argument("--output", "-o", default="vst_audit_report.txt", help="Output file (CLI mode)")
+    parser.add_argument("--no-cache", action="store_true", help="Re-parse every project instead of reusing cached results (CLI mode)")
     
     args = parser.parse_args()
     
@@ -448,7 +744,7 @@ def main():
             return 1
         
         # Command-line mode
-        auditor = AbletonVSTAuditor()
+        auditor = AbletonVSTAuditor(cache_path=None if args.no_cache else DEFAULT_CACHE_PATH)
         auditor.progress_callback = lambda msg: print(msg)
         
         print(f"Scanning directory: {args.directory}")
@@ -2,132 +2,216 @@
 """
 Ableton VST Auditor Installation Script
 Checks system requirements and provides setup instructions.
+
+Pass --quiet (or --only-check), or set CI or NO_GUI (to anything but empty,
+0 or false), to only run the Python and module checks and report the result
+in one line and the exit code.
 """
 
+import os
 import sys
-import platform
+import functools
 import subprocess
-import tkinter as tk
-from tkinter import messagebox
+from importlib.util import find_spec
+
+_PLATFORM = sys.platform
+_MIN_PYTHON = (3, 6)
+# find_spec locates pure-Python wrappers such as gzip even when the C extension
+# behind them was left out of the build, so those extensions are probed directly
+_REQUIRED_MODULES = (
+    'gzip', 'zlib', 'xml.etree.ElementTree', 'pyexpat', 'os', 'sys', 'argparse',
+    'collections', 'datetime', 'threading', 'concurrent.futures', 'mmap'
+)
 
 def check_python_version():
     """Check if Python version is adequate."""
     version = sys.version_info
-    if version.major >= 3 and version.minor >= 6:
-        return True, f"{version.major}.{version.minor}.{version.micro}"
-    return False, f"{version.major}.{version.minor}.{version.micro}"
+    return version >= _MIN_PYTHON, f"{version.major}.{version.minor}.{version.micro}"
+
+@functools.lru_cache(maxsize=1)
+def _get_tk():
+    """Import Tkinter on first use and reuse the loaded modules afterwards."""
+    import tkinter as tk
+    from tkinter import messagebox
+    return tk, messagebox
 
 def test_tkinter():
-    """Test if Tkinter is available for GUI."""
+    """Test if Tkinter is available for GUI.
+    
+    On success the hidden root window is returned so the caller can reuse it
+    and must destroy it when done.
+    """
     try:
+        tk, _ = _get_tk()
         root = tk.Tk()
         root.withdraw()  # Hide the window
-        root.destroy()
-        return True, "Available"
+        return True, "Available", root
     except Exception as e:
-        return False, str(e)
+        return False, str(e), None
+
+@functools.lru_cache(maxsize=None)
+def _probe(module):
+    """Check that a module can be found without executing it."""
+    # Modules loaded during interpreter start-up need no finder lookup at all
+    if module in sys.modules:
+        # A None entry means imports of this module are blocked
+        return sys.modules[module] is not None
+    try:
+        return find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False
 
 def test_required_modules():
     """Test if all required modules are available."""
-    required_modules = ['gzip', 'xml.etree.ElementTree', 'os', 'sys', 'argparse', 'collections', 'datetime', 'threading']
-    missing = []
-    
-    for module in required_modules:
-        try:
-            __import__(module)
-        except ImportError:
-            missing.append(module)
+    missing = [module for module in _REQUIRED_MODULES if not _probe(module)]
     
     return len(missing) == 0, missing
 
+@functools.lru_cache(maxsize=None)
+def _system():
+    """Return the platform name, importing platform only for less common systems."""
+    if _PLATFORM.startswith('win'):
+        return "Windows"
+    if _PLATFORM == 'darwin':
+        return "Darwin"
+    if _PLATFORM.startswith('linux'):
+        return "Linux"
+    import platform
+    return platform.system()
+
+def _env_flag(name):
+    """True when an environment variable is set to anything but empty, 0 or false."""
+    return os.environ.get(name, '').strip().lower() not in ('', '0', 'false')
+
+def _quiet_mode():
+    """True when only the exit code matters (CI, packaging, headless use)."""
+    return (
+        '--quiet' in sys.argv or '--only-check' in sys.argv
+        or _env_flag('CI') or _env_flag('NO_GUI')
+    )
+
+def quick_check():
+    """Run only the Python version and module checks, reporting one line."""
+    python_ok, python_version = check_python_version()
+    modules_ok, missing_modules = test_required_modules()
+    
+    if not python_ok:
+        line = f"❌ Python {python_version} found, Python 3.6 or higher required"
+    elif not modules_ok:
+        line = f"❌ Missing required modules: {', '.join(missing_modules)}"
+    else:
+        line = f"✅ Python {python_version} with all required modules available"
+    
+    sys.stdout.write(line + "\n")
+    return python_ok and modules_ok
+
+def _write_lines(lines):
+    """Write collected output lines to stdout in one call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 def main():
-    print("Ableton VST Auditor - Installation Check")
-    print("=" * 50)
-    print()
+    if _quiet_mode():
+        return quick_check()
+    
+    out = []
+    emit = out.append
+    
+    emit("Ableton VST Auditor - Installation Check")
+    emit("=" * 50)
+    emit("")
     
     # Check Python version
     python_ok, python_version = check_python_version()
-    print(f"Python Version: {python_version}")
+    emit(f"Python Version: {python_version}")
     if python_ok:
-        print("✅ Python version is compatible")
+        emit("✅ Python version is compatible")
     else:
-        print("❌ Python 3.6 or higher required")
-        print("   Please update Python from https://python.org/downloads/")
+        emit("❌ Python 3.6 or higher required")
+        emit("   Please update Python from https://python.org/downloads/")
+        _write_lines(out)
         return False
     
-    print()
+    emit("")
     
     # Check required modules
     modules_ok, missing_modules = test_required_modules()
     if modules_ok:
-        print("✅ All required Python modules available")
+        emit("✅ All required Python modules available")
+        if not _probe('_sqlite3'):
+            emit("⚠️  sqlite3 not available - scans will work but results will not be cached")
     else:
-        print("❌ Missing required modules:")
+        emit("❌ Missing required modules:")
         for module in missing_modules:
-            print(f"   - {module}")
+            emit(f"   - {module}")
+        _write_lines(out)
         return False
     
-    print()
+    emit("")
     
     # Check Tkinter for GUI
-    tkinter_ok, tkinter_status = test_tkinter()
+    tkinter_ok, tkinter_status, root = test_tkinter()
     if tkinter_ok:
-        print("✅ Tkinter available - GUI mode supported")
+        emit("✅ Tkinter available - GUI mode supported")
     else:
-        print("⚠️  Tkinter not available - GUI mode not supported")
-        print("   Command-line mode will still work")
-        print(f"   Error: {tkinter_status}")
+        emit("⚠️  Tkinter not available - GUI mode not supported")
+        emit("   Command-line mode will still work")
+        emit(f"   Error: {tkinter_status}")
     
-    print()
+    emit("")
     
     # Platform-specific instructions
-    system = platform.system()
-    print(f"Platform: {system}")
-    print()
-    
-    if system == "Windows":
-        print("🪟 Windows Instructions:")
-        print("   GUI Mode:  python ableton_vst_audit.py")
-        print("   CLI Mode:  python ableton_vst_audit.py --cli \"C:\\Path\\To\\Projects\"")
-    elif system == "Darwin":  # macOS
-        print("🍎 macOS Instructions:")
-        print("   GUI Mode:  python3 ableton_vst_audit.py")
-        print("   CLI Mode:  python3 ableton_vst_audit.py --cli \"/Users/YourName/Music/Ableton\"")
+    system = _system()
+    emit(f"Platform: {system}")
+    emit("")
+    
+    if _PLATFORM.startswith('win'):
+        emit("🪟 Windows Instructions:")
+        emit("   GUI Mode:  python ableton_vst_audit.py")
+        emit("   CLI Mode:  python ableton_vst_audit.py --cli \"C:\\Path\\To\\Projects\"")
+    elif _PLATFORM == 'darwin':  # macOS
+        emit("🍎 macOS Instructions:")
+        emit("   GUI Mode:  python3 ableton_vst_audit.py")
+        emit("   CLI Mode:  python3 ableton_vst_audit.py --cli \"/Users/YourName/Music/Ableton\"")
     else:  # Linux and others
-        print("🐧 Linux Instructions:")
-        print("   GUI Mode:  python3 ableton_vst_audit.py")
-        print("   CLI Mode:  python3 ableton_vst_audit.py --cli \"/home/user/ableton-projects\"")
-    
-    print()
-    print("✅ Installation check complete!")
-    print()
-    print("Next steps:")
-    print("1. Save 'ableton_vst_audit.py' to your desired location")
-    print("2. Run using the appropriate command above")
-    print("3. For GUI mode, just double-click the .py file (on some systems)")
-    print()
+        emit("🐧 Linux Instructions:")
+        emit("   GUI Mode:  python3 ableton_vst_audit.py")
+        emit("   CLI Mode:  python3 ableton_vst_audit.py --cli \"/home/user/ableton-projects\"")
+    
+    emit("")
+    emit("✅ Installation check complete!")
+    emit("")
+    emit("Next steps:")
+    emit("1. Save 'ableton_vst_audit.py' to your desired location")
+    emit("2. Run using the appropriate command above")
+    emit("3. For GUI mode, just double-click the .py file (on some systems)")
+    emit("")
+    
+    # Console output goes out before the (modal) success dialog
+    _write_lines(out)
     
     if tkinter_ok:
         try:
             # Show a simple success message in GUI
-            root = tk.Tk()
-            root.withdraw()
+            _, messagebox = _get_tk()
             messagebox.showinfo(
                 "Installation Check Complete", 
                 "✅ All requirements met!\n\n"
                 "The Ableton VST Auditor is ready to run.\n\n"
                 f"Platform: {system}\n"
                 f"Python: {python_version}\n"
-                "GUI Mode: Supported"
+                "GUI Mode: Supported",
+                parent=root
             )
-            root.destroy()
         except:
             pass  # If GUI fails, we already showed console output
+        finally:
+            root.destroy()
     
     return True
 
 if __name__ == "__main__":
     success = main()
     if not success:
-        input("\nPress Enter to exit...")
+        if not _quiet_mode():
+            input("\nPress Enter to exit...")
         sys.exit(1)
\ No newline at end of file